@@ -0,0 +1,26 @@
+ADMIT_DISK = 0
+ADMIT_MEMORY = 0
+ARTIFACT_STORE = None
+ARTIFACT_STORE_SIZE = 53687091200
+BINDIR = '/opt/rtems/deploy/bin'
+BUILD_FILTER = None
+CPU_BUDGET = None
+DEB_DATE = 'Sun, 18 Oct 2026 00:10:18 +0000'
+DPKG_DEB = ['/usr/bin/dpkg-deb']
+FAKEROOT = ['/usr/bin/fakeroot']
+LIBDIR = '/opt/rtems/deploy/lib64'
+NO_INSTALL = True
+PACKAGER = True
+PARALLEL_BUILDSETS = 1
+PREFIX = '/opt/rtems/deploy'
+RPMBUILD = ['/tmp/fakebin/rpmbuild']
+RSB_OPTIONS = []
+RSB_PATH = '/tmp/rsb'
+RSB_RELEASED = False
+RSB_REVISION = 'abc123'
+RSB_SET_BUILDER = '/tmp/rsb/source-builder/sb-set-builder'
+RSB_SOURCES = None
+RSB_VERSION = '6'
+STAGE_CACHE = False
+TAR_COMPRESS = 'bz2'
+WORK_DIR = None
@@ -0,0 +1,2 @@
+version = 0x2010400
+tools = []
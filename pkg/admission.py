@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Admission Control
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+import os
+import shutil
+import threading
+import time
+
+from waflib import Logs
+
+_cond = threading.Condition()
+
+log = 'admission.log'
+
+# Seconds between checks while held, a buildset finishing checks at once
+poll = 10
+
+# A buildset started in this many seconds is assumed not to have used
+# the resources it needs yet
+settle = 120
+
+
+def _gib(size):
+    return '%.1fG' % (size / 1024.0**3)
+
+
+def free_memory():
+    '''the host's available memory in bytes, None if not known'''
+    try:
+        with open('/proc/meminfo') as f:
+            for l in f:
+                ls = l.split()
+                if ls[0] == 'MemAvailable:':
+                    return int(ls[1]) * 1024
+    except (IOError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _paths(bld):
+    '''the paths the builds write to, one per file system'''
+    builddir = os.path.join(bld.path.abspath(), 'build')
+    for o in bld.env.RSB_OPTIONS:
+        if o.startswith('--builddir='):
+            builddir = os.path.abspath(o[len('--builddir='):])
+    if bld.env.WORK_DIR:
+        builddir = bld.env.WORK_DIR
+    paths = {}
+    for p in [bld.path.get_bld().abspath(), builddir]:
+        while not os.path.exists(p):
+            p = os.path.dirname(p)
+        dev = os.stat(p).st_dev
+        if dev not in paths:
+            paths[dev] = p
+    return sorted(paths.values())
+
+
+def setup(bld):
+    '''set up the admission of buildsets for a build'''
+    bld.admission = {
+        'memory': bld.env.ADMIT_MEMORY or 0,
+        'disk': bld.env.ADMIT_DISK or 0,
+        'paths': _paths(bld),
+        'log': os.path.join(bld.path.get_bld().abspath(), log),
+        'running': {}
+    }
+
+
+def _log(adm, name, decision, state):
+    line = '%s %s %s %s' % (time.strftime('%Y-%m-%d %H:%M:%S'), name,
+                            decision, state)
+    with open(adm['log'], 'a') as f:
+        f.write(line + os.linesep)
+    if decision != 'admit':
+        Logs.info('admission: ' + name + ': ' + decision + ' ' + state)
+
+
+def _check(adm):
+    '''the resources short of what a buildset needs and the state'''
+    now = time.time()
+    settling = len(
+        [s for s in adm['running'].values() if now - s < settle])
+    short = []
+    state = ['running=%d' % (len(adm['running']))]
+    if adm['memory']:
+        need = adm['memory'] * (1 + settling)
+        free = free_memory()
+        if free is not None:
+            state += ['mem=%s/%s' % (_gib(free), _gib(need))]
+            if free < need:
+                short += ['memory']
+    if adm['disk']:
+        need = adm['disk'] * (1 + settling)
+        for p in adm['paths']:
+            free = shutil.disk_usage(p).free
+            state += ['disk=%s/%s:%s' % (_gib(free), _gib(need), p)]
+            if free < need and 'disk' not in short:
+                short += ['disk']
+    return short, ' '.join(state)
+
+
+def acquire(bld, name):
+    '''wait until there are the resources to start a buildset'''
+    adm = getattr(bld, 'admission', None)
+    if adm is None:
+        return
+    if not adm['memory'] and not adm['disk']:
+        with _cond:
+            adm['running'][name] = time.time()
+        return
+    start = time.time()
+    held = False
+    with _cond:
+        while True:
+            short, state = _check(adm)
+            if len(short) == 0:
+                if held:
+                    _log(adm, name,
+                         'resume after %ds' % (time.time() - start), state)
+                else:
+                    _log(adm, name, 'admit', state)
+                break
+            if len(adm['running']) == 0:
+                # Nothing running will free the resources
+                _log(adm, name, 'admit low ' + ','.join(short), state)
+                break
+            if not held:
+                _log(adm, name, 'hold low ' + ','.join(short), state)
+                held = True
+            _cond.wait(poll)
+        adm['running'][name] = time.time()
+
+
+def release(bld, name):
+    '''a buildset has finished and its resources are free'''
+    adm = getattr(bld, 'admission', None)
+    if adm is None:
+        return
+    with _cond:
+        adm['running'].pop(name, None)
+        _cond.notify_all()
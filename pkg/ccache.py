@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Compiler Cache
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+import os
+import shutil
+
+# The host compilers the RSB's builds run, linked to ccache
+compilers = ['cc', 'c++', 'gcc', 'g++', 'clang', 'clang++']
+
+
+def enabled(bld):
+    return bool(bld.env.COMPILER_CACHE)
+
+
+def configure(conf, path, size):
+    '''create the compiler links and set the cache's size limit'''
+    conf.find_program('ccache', var='CCACHE')
+    path = os.path.abspath(path)
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError as e:
+        conf.fatal('compiler cache: ' + str(e))
+    bindir = conf.bldnode.make_node('ccache-bin')
+    if os.path.exists(bindir.abspath()):
+        shutil.rmtree(bindir.abspath())
+    bindir.mkdir()
+    for c in compilers:
+        # Only a compiler the host has, ccache needs to find the real one
+        if shutil.which(c) is not None:
+            os.symlink(conf.env.CCACHE[0], bindir.make_node(c).abspath())
+    env = dict(os.environ)
+    env['CCACHE_DIR'] = path
+    conf.cmd_and_log(conf.env.CCACHE + ['--max-size=%dG' % (size)], env=env)
+    conf.env.COMPILER_CACHE = path
+    conf.env.COMPILER_CACHE_SIZE = size
+    conf.env.COMPILER_CACHE_BIN = bindir.abspath()
+    conf.msg('Compiler cache', path, color='GREEN')
+    conf.msg('Compiler cache size', '%d GiB' % (size), color='GREEN')
+
+
+def _vars(bld):
+    # Paths under the base are hashed relative to it so the same
+    # sources in different build trees hit. The root would rewrite the
+    # system header paths.
+    base = os.path.commonpath([bld.path.abspath(), bld.env.RSB_PATH])
+    if base == os.sep:
+        base = bld.path.abspath()
+    return [('CCACHE_DIR', bld.env.COMPILER_CACHE),
+            ('CCACHE_MAXSIZE', '%dG' % (bld.env.COMPILER_CACHE_SIZE)),
+            ('CCACHE_BASEDIR', base), ('CCACHE_NOHASHDIR', 'true')]
+
+
+def env(bld, environ=None, stats=None):
+    '''the RSB's environment with the compiler cache'''
+    if environ is None:
+        environ = os.environ
+    environ = dict(environ)
+    environ.update(_vars(bld))
+    environ['PATH'] = bld.env.COMPILER_CACHE_BIN + os.pathsep + \
+        environ.get('PATH', '')
+    if stats is not None:
+        environ['CCACHE_STATSLOG'] = stats
+    return environ
+
+
+def rpm_exports(bld):
+    '''shell exports for an RPM spec file's build'''
+    if not enabled(bld):
+        return ''
+    lines = ['export %s=%s' % (n, v) for n, v in _vars(bld)]
+    lines += ['export PATH=%s:$PATH' % (bld.env.COMPILER_CACHE_BIN)]
+    return os.linesep.join(lines)
+
+
+def deb_exports(bld):
+    '''make exports for a Debian rules file'''
+    if not enabled(bld):
+        return ''
+    lines = ['export %s = %s' % (n, v) for n, v in _vars(bld)]
+    lines += ['export PATH := %s:$(PATH)' % (bld.env.COMPILER_CACHE_BIN)]
+    return os.linesep.join(lines)
+
+
+def stats(path):
+    '''the hits and misses in a ccache stats log, None if there is none'''
+    hits = 0
+    misses = 0
+    try:
+        with open(path) as f:
+            for l in f:
+                l = l.strip()
+                if l in ['direct_cache_hit', 'preprocessed_cache_hit']:
+                    hits += 1
+                elif l == 'cache_miss':
+                    misses += 1
+    except IOError:
+        return None
+    return {'hits': hits, 'misses': misses}
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Tar File Compression
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import contextlib
+import os
+import subprocess
+import tarfile
+
+# The RSB writes bzip2 compressed tar files
+rsb_format = 'bz2'
+
+formats = {
+    'bz2': {
+        'ext': '.tar.bz2',
+        'compress': ['bzip2', '-c'],
+        'decompress': ['bzip2', '-dc'],
+        'extract': 'jxf'
+    },
+    'gz': {
+        'ext': '.tar.gz',
+        'compress': ['gzip', '-c'],
+        'decompress': ['gzip', '-dc'],
+        'extract': 'zxf'
+    },
+    'xz': {
+        'ext': '.tar.xz',
+        'compress': ['xz', '-T0', '-c'],
+        'decompress': ['xz', '-T0', '-dc'],
+        'extract': "--use-compress-program='xz -d -T0' -xf"
+    },
+    'zstd': {
+        'ext': '.tar.zst',
+        'compress': ['zstd', '-T0', '-q', '-c'],
+        'decompress': ['zstd', '-T0', '-dc'],
+        'extract': "--use-compress-program='zstd -d -T0' -xf"
+    }
+}
+
+
+def ext(fmt):
+    return formats[fmt or rsb_format]['ext']
+
+
+def extract(fmt):
+    '''the tar options to extract a tar file in the format'''
+    return formats[fmt or rsb_format]['extract']
+
+
+def convert(src, dst, fmt):
+    '''recompress the RSB tar file src into dst in the format'''
+    tmp = dst + '.tmp'
+    with open(tmp, 'wb') as out:
+        decomp = subprocess.Popen(formats[rsb_format]['decompress'] + [src],
+                                  stdout=subprocess.PIPE)
+        try:
+            comp = subprocess.Popen(formats[fmt]['compress'],
+                                    stdin=decomp.stdout,
+                                    stdout=out)
+            decomp.stdout.close()
+            comp_ret = comp.wait()
+        finally:
+            decomp_ret = decomp.wait()
+    if decomp_ret != 0 or comp_ret != 0:
+        os.remove(tmp)
+        return 1
+    os.replace(tmp, dst)
+    return 0
+
+
+def format_of(tar):
+    '''the format of a tar file from its name'''
+    for fmt in formats:
+        if tar.endswith(formats[fmt]['ext']):
+            return fmt
+    raise IOError('unknown tar file format: ' + tar)
+
+
+@contextlib.contextmanager
+def stream(tar, fmt=None):
+    '''read the tar file as a stream decompressed using all CPUs'''
+    if fmt is None:
+        fmt = format_of(tar)
+    decomp = subprocess.Popen(formats[fmt]['decompress'] + [tar],
+                              stdout=subprocess.PIPE)
+    try:
+        with tarfile.open(fileobj=decomp.stdout, mode='r|') as tf:
+            yield tf
+        # Read the padding after the end of the archive
+        while decomp.stdout.read(1024 * 1024):
+            pass
+    finally:
+        decomp.stdout.close()
+        ret = decomp.wait()
+    if ret != 0:
+        raise IOError('decompress failed: ' + tar)
+
+
+@contextlib.contextmanager
+def write(tar, fmt):
+    '''write a tar file as a stream compressed using all CPUs'''
+    tmp = tar + '.tmp'
+    ok = False
+    try:
+        with open(tmp, 'wb') as out:
+            comp = subprocess.Popen(formats[fmt or rsb_format]['compress'],
+                                    stdin=subprocess.PIPE,
+                                    stdout=out)
+            try:
+                with tarfile.open(fileobj=comp.stdin, mode='w|') as tf:
+                    yield tf
+            finally:
+                comp.stdin.close()
+                ret = comp.wait()
+        if ret != 0:
+            raise IOError('compress failed: ' + tar)
+        os.replace(tmp, tar)
+        ok = True
+    finally:
+        if not ok and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def members(tar, fmt):
+    '''the names of the files in a tar file in the format'''
+    names = set()
+    with stream(tar, fmt or rsb_format) as tf:
+        for ti in tf:
+            if not ti.isdir():
+                names.add(ti.name)
+    return names
@@ -28,14 +28,30 @@ RSB Deployment Configurations
 # POSSIBILITY OF SUCH DAMAGE.
 #
 
+import json
 import re
 import os
 import sys
 
-from waflib import Context
+import pkg.compress
+import pkg.fetch
+import pkg.store
+
+from waflib import Context, Logs, Options, Utils
 
 path = 'config'
 
+discovery = 'discovery.json'
+
+#
+# RSB tool buildsets that can be built once as a stage shared by buildsets
+#
+stage_archs = [
+    'aarch64', 'arm', 'bfin', 'i386', 'lm32', 'm32c', 'm68k', 'microblaze',
+    'mips', 'moxie', 'nios2', 'or1k', 'powerpc', 'riscv', 'sh', 'sparc',
+    'sparc64', 'v850', 'x86_64'
+]
+
 
 def init(ctx):
     pass
@@ -46,6 +62,16 @@ def options(opt):
                    default=None,
                    dest='builds',
                    help='Regex filter of buildset to build')
+    opt.add_option('--from-tar',
+                   action='store_true',
+                   default=False,
+                   dest='from_tar',
+                   help='Package the built tar file if its inputs are current')
+    opt.add_option('--split-packages',
+                   action='store_true',
+                   default=False,
+                   dest='split_packages',
+                   help='Split packages into component packages, needs --from-tar')
 
 
 def configure(conf):
@@ -91,6 +117,280 @@ def config_dir(config):
     return os.path.dirname(config_path(config))
 
 
+def bset_parse(bld, buildset):
+    '''parse a buildset into its defines, includes and config lines'''
+    node = bld.path.find_resource(config_path(buildset))
+    if node is None:
+        return None
+    lines = []
+    line = ''
+    for l in node.read().splitlines():
+        l = l.strip()
+        if l.startswith('#'):
+            continue
+        if l.endswith('\\'):
+            line += l[:-1] + ' '
+            continue
+        line += l
+        if len(line) > 0:
+            lines += [line]
+        line = ''
+    if len(line) > 0:
+        lines += [line]
+    defines = {}
+    includes = []
+    configs = []
+    for l in lines:
+        ls = l.split(None, 2)
+        if ls[0] == '%define':
+            if len(ls) == 3:
+                defines[ls[1]] = ls[2]
+            elif len(ls) == 2:
+                defines[ls[1]] = ''
+        elif ls[0] == '%include':
+            if len(ls) > 1:
+                includes += [ls[1]]
+        elif not l.startswith('%') or l.startswith('%{'):
+            configs += [l]
+    return {
+        'buildset': buildset,
+        'node': node,
+        'lines': lines,
+        'defines': defines,
+        'includes': includes,
+        'configs': configs
+    }
+
+
+def bset_deps(bld, buildset):
+    '''find the nodes in this repo a buildset depends on'''
+    deps = []
+    visited = []
+
+    def _add(node):
+        if node is not None and node not in deps:
+            deps.append(node)
+
+    def _deps(buildset):
+        if buildset in visited:
+            return
+        visited.append(buildset)
+        bp = bset_parse(bld, buildset)
+        if bp is None:
+            return
+        _add(bp['node'])
+        ini = bp['defines'].get('with_rtems_bsp_config')
+        if ini is not None:
+            _add(bld.path.find_resource(ini))
+        for i in bp['includes']:
+            _add(bld.path.find_resource(i))
+        for c in bp['configs']:
+            if '%' not in c:
+                _deps(c)
+
+    _deps(buildset)
+    return deps
+
+
+def rsb_config_dirs(bld):
+    '''the RSB's config directories that exist'''
+    dirs = []
+    if bld.env.RSB_PATH:
+        for d in ['rtems', 'bare', 'source-builder']:
+            cd = os.path.join(bld.env.RSB_PATH, d, 'config')
+            if os.path.isdir(cd):
+                dirs += [cd]
+    return dirs
+
+
+def bset_validate(bld, buildset):
+    '''check a buildset's files and references without running the RSB
+
+    Missing files and cycles are errors. Anything else the RSB may still
+    accept, such as a macro it defines, is a warning.
+    '''
+    errors = []
+    warnings = []
+    rsb_dirs = rsb_config_dirs(bld)
+    macro = re.compile(r'%{([^}?!:]+)}')
+
+    def _expand(text, defines, where):
+        for m in macro.findall(text):
+            if m == 'rtems_version' or m.startswith('_'):
+                # The RSB defines the macros starting with '_'
+                continue
+            if m not in defines:
+                warnings.append(where + ': undefined macro: %{' + m + '}')
+        return text.replace('%{rtems_version}', str(bld.env.RSB_VERSION))
+
+    def _rsb_config(config):
+        if len(rsb_dirs) == 0:
+            # Nothing to check against
+            return True
+        for d in rsb_dirs:
+            for ext in ['.bset', '.cfg']:
+                if os.path.isfile(os.path.join(d, config + ext)):
+                    return True
+        return False
+
+    def _validate(buildset, defines, stack):
+        where = config_path(buildset)
+        if buildset in stack:
+            errors.append(where + ': cycle: ' +
+                          ' -> '.join(stack + [buildset]))
+            return
+        bp = bset_parse(bld, buildset)
+        if bp is None:
+            errors.append(where + ': not found')
+            return
+        stack = stack + [buildset]
+        for l in bp['lines']:
+            ls = l.split(None, 2)
+            if ls[0] == '%define':
+                if len(ls) < 2:
+                    warnings.append(where + ': invalid define: ' + l)
+                    continue
+                defines = dict(defines)
+                defines[ls[1]] = ''
+                if ls[1] == 'with_rtems_bsp_config' and len(ls) == 3:
+                    ini = _expand(ls[2], defines, where)
+                    if bld.path.find_resource(ini) is None:
+                        errors.append(where + ': BSP config not found: ' +
+                                      ini)
+                    else:
+                        config = get_config_parser()
+                        try:
+                            config.read(ini)
+                        except get_config_error() as ce:
+                            warnings.append(where + ': BSP config: ' +
+                                            str(ce))
+            elif ls[0] == '%include':
+                if len(ls) < 2:
+                    warnings.append(where + ': invalid include: ' + l)
+                    continue
+                inc = _expand(ls[1], defines, where)
+                if bld.path.find_resource(inc) is None and \
+                   not _rsb_config(os.path.splitext(inc)[0]):
+                    errors.append(where + ': include not found: ' + inc)
+            elif l in bp['configs']:
+                config = _expand(l, defines, where)
+                if bld.path.find_resource(config_path(config)) is not None:
+                    _validate(config, defines, stack)
+                elif not _rsb_config(config):
+                    errors.append(where + ': config not found: ' + config)
+
+    _validate(buildset, {}, [])
+    return {'errors': errors, 'warnings': warnings}
+
+
+def bset_stage(bld, buildset):
+    '''find the leading RSB tools a buildset builds and the defines it uses'''
+    bp = bset_parse(bld, buildset)
+    if bp is None:
+        return None
+    defines = []
+    for index, l in enumerate(bp['lines']):
+        if l.startswith('%define'):
+            defines += [l]
+        elif l in bp['configs']:
+            ls = l.split('/')
+            if len(ls) != 2 or not ls[1].startswith('rtems-') or \
+               ls[1][len('rtems-'):] not in stage_archs:
+                return None
+            key = Utils.to_hex(Utils.h_list(defines + [l]))
+            return {
+                'name': os.path.basename(l) + '-' + key[:8],
+                'config': l,
+                'defines': defines,
+                'index': index
+            }
+        elif l.startswith('%include'):
+            return None
+    return None
+
+
+def shared_stages(bld, builds):
+    '''find the leading stages shared by more than one buildset'''
+    stages = {}
+    for build in builds:
+        stage = bset_stage(bld, build['buildset'])
+        if stage is None:
+            continue
+        if stage['name'] not in stages:
+            stages[stage['name']] = {
+                'name': stage['name'],
+                'config': stage['config'],
+                'defines': stage['defines'],
+                'buildsets': []
+            }
+        stages[stage['name']]['buildsets'] += [build['buildset']]
+    return dict([(n, s) for n, s in stages.items() if len(s['buildsets']) > 1])
+
+
+def bset_configs(bld, buildset):
+    '''the RSB configs a buildset builds with the lines defining each'''
+    configs = []
+    visited = []
+
+    def _configs(buildset, defines):
+        if buildset in visited:
+            return defines
+        visited.append(buildset)
+        bp = bset_parse(bld, buildset)
+        if bp is None:
+            return defines
+        for l in bp['lines']:
+            if l.startswith('%define') or l.startswith('%include'):
+                defines = defines + [l]
+            elif l in bp['configs']:
+                if bld.path.find_resource(config_path(l)) is not None:
+                    defines = _configs(l, defines)
+                else:
+                    configs.append((defines, l))
+        return defines
+
+    _configs(buildset, [])
+    return configs
+
+
+def fetch_configs(bld, builds):
+    '''the unique RSB configs the buildsets build'''
+    fetches = {}
+    for build in builds:
+        for defines, config in bset_configs(bld, build['buildset']):
+            key = Utils.to_hex(Utils.h_list(defines + [config]))
+            name = os.path.basename(config) + '-' + key[:8]
+            if name not in fetches:
+                fetches[name] = {
+                    'name': name,
+                    'config': config,
+                    'defines': defines,
+                    'buildsets': []
+                }
+            fetches[name]['buildsets'] += [build['buildset']]
+    return fetches
+
+
+def bset_write(node, lines):
+    text = os.linesep.join(['#', '# Generated, do not edit', '#'] + lines)
+    text += os.linesep
+    if not node.exists() or node.read() != text:
+        node.parent.mkdir()
+        node.write(text)
+
+
+def bset_seed(bld, buildset):
+    '''write the buildset without its leading stage, None if nothing is left'''
+    bp = bset_parse(bld, buildset)
+    stage = bset_stage(bld, buildset)
+    lines = bp['lines'][:stage['index']] + bp['lines'][stage['index'] + 1:]
+    if len([l for l in lines if l in bp['configs']]) == 0:
+        return None
+    node = bld.path.get_bld().make_node('seed/' + buildset + '.bset')
+    bset_write(node, lines)
+    return node
+
+
 def add_wscript_fun(ctx, fun_name, fun_func):
     node = ctx.path.find_node(Context.WSCRIPT_FILE)
     if node:
@@ -98,9 +398,31 @@ def add_wscript_fun(ctx, fun_name, fun_func):
         setattr(wscript_module, fun_name, fun_func)
 
 
+def buildset_index(configs):
+    '''index the buildsets by their config directory and their basename'''
+    by_dir = {}
+    by_name = {}
+    for c in configs:
+        d = os.path.abspath(config_dir(c['buildset']))
+        by_dir.setdefault(d, []).append(c)
+        by_name.setdefault(os.path.basename(c['buildset']), []).append(c)
+    return by_dir, by_name
+
+
 def configs_ini_load(bld, inis, configs):
+    values = {}
+    version = []
+
+    def rsb_version():
+        if len(version) == 0:
+            try:
+                version.append(int(bld.env.RSB_VERSION))
+            except:
+                bld.fatal('cannot convert RSB version to a number: ' +
+                          bld.env.RSB_VERSION)
+        return version[0]
 
-    def parse_types(bld, value):
+    def parse_types(value):
         vs = value.lower().strip().split(' ')
         if len(vs) == 1:
             if vs[0] == 'true':
@@ -111,11 +433,7 @@ def configs_ini_load(bld, inis, configs):
         if vs[0] == 'version':
             if len(vs) != 3:
                 return None
-            try:
-                rev = int(bld.env.RSB_VERSION)
-            except:
-                bld.fatal('cannot convert RSB version to a number: ' +
-                          bld.env.RSB_VERSION)
+            rev = rsb_version()
             try:
                 val = int(vs[2])
             except:
@@ -135,41 +453,52 @@ def configs_ini_load(bld, inis, configs):
             return None
         return None
 
+    def value(value):
+        # Values are repeated across the INI files, evaluate each once
+        if value not in values:
+            values[value] = parse_types(value)
+        return values[value]
+
+    by_dir, by_name = buildset_index(configs)
     for ini in inis:
         config = get_config_parser()
         try:
             config.read(ini)
-        except pkg.configs.get_config_error() as ce:
+        except get_config_error() as ce:
             bld.fatal('configs ini parse error: ' + str(ce))
         ini_dir = os.path.dirname(os.path.abspath(ini))
-        for d in config.defaults():
-            i = (d, config.defaults()[d])
-            val = parse_types(bld, i[1])
+        defaults = config.defaults()
+        dir_configs = by_dir.get(ini_dir, [])
+        for d in defaults:
+            val = value(defaults[d])
             if val is None:
                 bld.fatal('invalid configs item in ' + ini + ': defaults: ' +
-                          i[0] + ' = ' + i[1])
-            for c in configs:
-                if ini_dir == os.path.abspath(config_dir(c['buildset'])):
-                    c[d] = val
+                          d + ' = ' + defaults[d])
+            for c in dir_configs:
+                c[d] = val
         for section in config.sections():
-            for c in configs:
-                if section == os.path.basename(c['buildset']):
-                    try:
-                        items = config.items(section)
-                    except pkg.configs.get_config_error() as ce:
-                        bld.fatal('configs ini parse error: ' + str(ce))
-                    for i in items:
-                        val = parse_types(bld, i[1])
-                        if val is None:
-                            bld.fatal('invalid configs item in ' + ini + ': ' +
-                                      section + ': ' + i[0] + ' = ' + i[1])
-                        c[i[0]] = val
+            name_configs = by_name.get(section)
+            if name_configs is None:
+                continue
+            try:
+                items = config.items(section)
+            except get_config_error() as ce:
+                bld.fatal('configs ini parse error: ' + str(ce))
+            for i in items:
+                val = value(i[1])
+                if val is None:
+                    bld.fatal('invalid configs item in ' + ini + ': ' +
+                              section + ': ' + i[0] + ' = ' + i[1])
+                for c in name_configs:
+                    c[i[0]] = val
 
 
-def find_buildsets(bld):
+def discover(bld):
     discovered = []
     inis = []
+    dirs_ = []
     for root, dirs, files in os.walk(path):
+        dirs_ += [root]
         base = root[len('config') + 1:]
         for f in files:
             r, e = os.path.splitext(f)
@@ -187,40 +516,269 @@ def find_buildsets(bld):
         bf = re.compile(bld.env.BUILD_FILTER)
         bs = [b for b in bs if bf.match(b['buildset'])]
     configs_ini_load(bld, inis, bs)
-    return sorted([b for b in bs if b['enabled']],
-                  key=lambda bs: bs['buildset'])
+    return dirs_ + inis, bs
 
 
-def buildset(bld, build, dry_run):
-    name = os.path.basename(build['buildset'])
-    log = bld.path.get_bld().find_or_declare(build['buildset'] + '.txt')
-    config = config_path(build['buildset'])
-    bset = bld.path.find_resource(config)
-    if buildset is None:
-        bld.fatal('buildset not found: ' + build['buildset'])
-    tardir = bld.path.make_node('tar')
-    tar = tardir.make_node(os.path.basename(build['buildset']) + '.tar.bz2')
-    cmd = bld.env.RSB_SET_BUILDER
+def discovery_mtimes(paths):
+    mtimes = {}
+    for p in paths:
+        try:
+            mtimes[p] = os.stat(p).st_mtime_ns
+        except OSError:
+            return None
+    return mtimes
+
+
+def discovery_key(bld):
+    return Utils.to_hex(
+        Utils.h_list([str(bld.env.BUILD_FILTER),
+                      str(bld.env.RSB_VERSION)]))
+
+
+def find_buildsets(bld):
+    '''find the enabled buildsets, reusing the last discovery if unchanged'''
+    # A directory's mtime changes when a buildset or configs.ini is added
+    # or removed so checking the directories and INI files is enough
+    cache = os.path.join(bld.path.get_bld().abspath(), discovery)
+    key = discovery_key(bld)
+    try:
+        with open(cache) as f:
+            saved = json.load(f)
+        if saved['key'] == key and \
+           discovery_mtimes(saved['mtimes']) == saved['mtimes']:
+            return saved['buildsets']
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        pass
+    paths, bs = discover(bld)
+    bs = sorted([b for b in bs if b['enabled']],
+                key=lambda bs: bs['buildset'])
+    mtimes = discovery_mtimes(paths)
+    if mtimes is not None:
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            with open(cache + '.tmp', 'w') as f:
+                json.dump({
+                    'key': key,
+                    'mtimes': mtimes,
+                    'buildsets': bs
+                }, f)
+            os.replace(cache + '.tmp', cache)
+        except EnvironmentError:
+            pass
+    return bs
+
+
+def inputs_key(bld, build):
+    '''a key for the inputs a buildset's tar file is built from'''
+    deps = bset_deps(bld, build['buildset'])
+    return Utils.to_hex(
+        Utils.h_list([Utils.h_file(d.abspath())
+                      for d in deps] + sorted(build.items()) + [
+                          bld.env.PREFIX, bld.env.NO_INSTALL,
+                          bld.env.RSB_OPTIONS, bld.env.RSB_REVISION,
+                          bld.env.TAR_COMPRESS
+                      ]))
+
+
+def tar_current(bld, build, bset):
+    '''is the buildset's tar file built from the current inputs?'''
+    if not os.path.isfile(bset['tar'].abspath()):
+        return False
+    try:
+        with open(bset['inputs'].abspath()) as f:
+            key = f.read().strip()
+    except EnvironmentError:
+        return False
+    return key == inputs_key(bld, build)
+
+
+def store_fetch(bld, build, bset):
+    '''fetch the buildset's tar file from the artifact store if stored'''
+    if Options.options.force:
+        # Forced to rebuild, do not use a stored tar file
+        return False
+    key = inputs_key(bld, build)
+    if not pkg.store.fetch(bld, key, bset['tar'].abspath()):
+        return False
+    bset['inputs'].parent.mkdir()
+    bset['inputs'].write(key)
+    return True
+
+
+def pkg_from_tar(bld, build, bset):
+    '''package from the tar file and not the RSB, 1 if yes else 0'''
+    current = tar_current(bld, build, bset)
+    if not current and store_fetch(bld, build, bset):
+        # A stored tar file has the same inputs, do not run the RSB
+        return '1'
+    if not Options.options.from_tar:
+        return '0'
+    if not current:
+        Logs.warn('tar file not current, packaging builds: ' +
+                  build['buildset'])
+        return '0'
+    return '1'
+
+
+def pkg_tar(bld, bset, from_tar):
+    '''the tar file packaged, its format and extract options
+
+    The RSB writes a bz2 tar file so a package built by the RSB
+    extracts that and not the recompressed tar file.
+    '''
+    if from_tar == '1':
+        fmt = bld.env.TAR_COMPRESS
+        tar = bset['tar']
+    else:
+        fmt = pkg.compress.rsb_format
+        tar = bset['rsb-tar']
+    return {'tar': tar, 'format': fmt, 'extract': pkg.compress.extract(fmt)}
+
+
+def find_targets(bld):
+    '''find the buildsets to package, limited by --targets and --builds'''
+    builds = find_buildsets(bld)
+    if Options.options.builds is not None:
+        try:
+            bf = re.compile(Options.options.builds)
+        except:
+            bld.fatal('Builds filter regex invalid')
+        builds = [b for b in builds if bf.match(b['buildset'])]
+    if bld.targets and bld.targets != '*':
+        targets = bld.targets.split(',')
+        names = [b['buildset'] for b in builds]
+        for t in targets:
+            if t not in names:
+                bld.fatal('target not found: ' + t)
+        builds = [b for b in builds if b['buildset'] in targets]
+        # The packaging task generators are not named by buildset, post
+        # all the generators created
+        bld.targets = ''
+    return builds
+
+
+def rsb_opts(bld, log):
     opts = [
         '--prefix=' + bld.env.PREFIX, '--bset-tar-file', '--trace',
         '--log=' + str(log.path_from(bld.path))
     ]
     opts += bld.env.RSB_OPTIONS
+    return opts
+
+
+def rsb_sources(bld, name, dry_run=False):
+    '''a concurrent run's private sources, None if it uses the shared'''
+    if dry_run or not bld.env.PARALLEL_BUILDSETS or \
+       bld.env.PARALLEL_BUILDSETS < 2:
+        return None
+    return bld.path.get_bld().make_node(name + '.sources').abspath()
+
+
+def rsb_opts_extra(bld, name, dry_run):
     opts_extra = []
     if bld.env.NO_INSTALL:
         opts_extra += ['--no-install']
-    if build['dry-run'] or dry_run:
+    if dry_run:
         opts_extra += ['--dry-run']
+    elif bld.env.PARALLEL_BUILDSETS and bld.env.PARALLEL_BUILDSETS > 1 \
+         and not bld.env.WORK_DIR:
+        # Concurrent buildsets can build the same package, keep the RSB
+        # build trees separate. A work directory is separate for each run.
+        builddir = bld.path.get_bld().make_node(name + '.build')
+        opts_extra += ['--builddir=' + builddir.abspath()]
+    sources = rsb_sources(bld, name, dry_run)
+    if sources is not None:
+        # Concurrent buildsets can download the same file, download to a
+        # private directory and move the files to the shared sources
+        opts_extra += pkg.fetch.rsb_opts(sources)
+    elif bld.env.RSB_SOURCES:
+        opts_extra += pkg.fetch.rsb_opts(bld.env.RSB_SOURCES)
+    return opts_extra
+
+
+def stage_buildset(bld, stage):
+    stagedir = bld.path.get_bld().make_node('stage')
+    bset = stagedir.make_node(stage['name'] + '.bset')
+    bset_write(bset, stage['defines'] + [stage['config']])
+    log = stagedir.make_node(stage['name'] + '.txt')
+    name = str(stagedir.make_node(stage['name']).path_from(bld.path))
+    opts = rsb_opts(bld, log)
+    opts_extra = rsb_opts_extra(bld, 'stage/' + stage['name'], False)
+    return {
+        'name': stage['name'],
+        'buildset': bset,
+        'log': log,
+        'output': stagedir.make_node(stage['name'] + '.output.gz'),
+        'rsb-tar': bld.path.make_node(['tar', stage['name'] + '.tar.bz2']),
+        'tar': stagedir.make_node(stage['name'] + '.tar.bz2'),
+        'root': stagedir.make_node(stage['name']),
+        'cmd': bld.env.RSB_SET_BUILDER,
+        'run-opts': opts + opts_extra + [name]
+    }
+
+
+def fetch_buildset(bld, fetch):
+    fetchdir = bld.path.get_bld().make_node('fetch')
+    bset = fetchdir.make_node(fetch['name'] + '.bset')
+    bset_write(bset, fetch['defines'] + [fetch['config']])
+    log = fetchdir.make_node(fetch['name'] + '.txt')
+    name = str(fetchdir.make_node(fetch['name']).path_from(bld.path))
+    sources = fetchdir.make_node(fetch['name'] + '.sources')
+    opts = rsb_opts(bld, log)
+    opts += ['--source-only-download'] + pkg.fetch.rsb_opts(
+        sources.abspath())
+    return {
+        'name': fetch['name'],
+        'buildset': bset,
+        'log': log,
+        'output': fetchdir.make_node(fetch['name'] + '.output.gz'),
+        'sources': sources,
+        'cmd': bld.env.RSB_SET_BUILDER,
+        'run-opts': opts + [name]
+    }
+
+
+def buildset(bld, build, dry_run):
+    name = os.path.basename(build['buildset'])
+    log = bld.path.get_bld().find_or_declare(build['buildset'] + '.txt')
+    output = bld.path.get_bld().find_or_declare(build['buildset'] +
+                                                '.output.gz')
+    inputs = bld.path.get_bld().find_or_declare(build['buildset'] +
+                                                '.inputs')
+    staging = bld.path.get_bld().make_node('staging/' + build['buildset'])
+    config = config_path(build['buildset'])
+    bset = bld.path.find_resource(config)
+    if buildset is None:
+        bld.fatal('buildset not found: ' + build['buildset'])
+    tardir = bld.path.make_node('tar')
+    rsb_tar = tardir.make_node(name + '.tar.bz2')
+    tar = tardir.make_node(name + pkg.compress.ext(bld.env.TAR_COMPRESS))
+    delta = tardir.make_node(name + '.delta.tar.xz')
+    cmd = bld.env.RSB_SET_BUILDER
+    opts = rsb_opts(bld, log)
+    opts_extra = rsb_opts_extra(bld, build['buildset'], build['dry-run']
+                                or dry_run)
     run_opts = opts + opts_extra + [build['buildset']]
-    pkg_opts = opts + ['--no-install', build['buildset']]
+    # Packages of different buildsets can be built at the same time
+    pkg_builddir = bld.path.get_bld().make_node(build['buildset'] + '.pkg')
+    pkg_opts = opts + [
+        '--no-install', '--builddir=' + pkg_builddir.abspath(),
+        build['buildset']
+    ]
     return {
         'name': name,
         'config': config,
         'buildset': bset,
         'log': log,
+        'output': output,
+        'inputs': inputs,
+        'staging': staging,
         'tardir': tardir,
+        'rsb-tar': rsb_tar,
         'tar': tar,
+        'delta': delta,
         'dry-run': build['dry-run'] or dry_run,
+        'deps': bset_deps(bld, build['buildset']),
         'cmd': cmd,
         'opts': opts,
         'opts-extra': opts_extra,
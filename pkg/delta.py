@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Buildset Tar File Deltas
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+
+import pkg.compress
+
+version = 1
+
+
+def _entry(ti):
+    entry = {'mode': ti.mode}
+    if ti.isdir():
+        entry['type'] = 'dir'
+    elif ti.issym():
+        entry['type'] = 'symlink'
+        entry['link'] = ti.linkname
+    elif ti.islnk():
+        entry['type'] = 'hardlink'
+        entry['link'] = ti.linkname
+    else:
+        entry['type'] = 'file'
+    return entry
+
+
+def _hash(f, spool=None):
+    h = hashlib.sha256()
+    for data in iter(lambda: f.read(1024 * 1024), b''):
+        h.update(data)
+        if spool is not None:
+            spool.write(data)
+    return h.hexdigest()
+
+
+def _stamp(tar):
+    st = os.stat(tar)
+    return '%d:%d' % (st.st_size, st.st_mtime_ns)
+
+
+def _manifest_path(bld, tar):
+    key = hashlib.sha256(os.path.abspath(tar).encode('utf-8')).hexdigest()
+    return os.path.join(bld.path.get_bld().abspath(), 'manifests',
+                        key[:16] + '.json')
+
+
+def manifest_load(bld, tar):
+    '''load the saved manifest of a tar file if the tar file is unchanged'''
+    try:
+        with open(_manifest_path(bld, tar)) as f:
+            saved = json.load(f)
+        if saved['stamp'] == _stamp(tar):
+            return saved['files']
+    except (EnvironmentError, ValueError, KeyError):
+        pass
+    return None
+
+
+def manifest_save(bld, tar, files):
+    path = _manifest_path(bld, tar)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'tar': tar, 'stamp': _stamp(tar), 'files': files}, f)
+    os.replace(path + '.tmp', path)
+
+
+def manifest(bld, tar):
+    '''the path, type, mode and content hash of each file in a tar file'''
+    files = manifest_load(bld, tar)
+    if files is None:
+        files = {}
+        with pkg.compress.stream(tar) as tf:
+            for ti in tf:
+                files[ti.name] = _entry(ti)
+                if ti.isreg():
+                    files[ti.name]['sha256'] = _hash(tf.extractfile(ti))
+        manifest_save(bld, tar, files)
+    return files
+
+
+def _changed(old, new):
+    return old is None or old != new
+
+
+def create(bld, old_tar, new_tar, delta_tar):
+    '''create a delta that updates old_tar's files to new_tar's files'''
+    old = manifest(bld, old_tar)
+    new = {}
+    changed = {}
+    tmp = delta_tar + '.tmp'
+    with tarfile.open(tmp, 'w:xz') as out, \
+         pkg.compress.stream(new_tar) as tf:
+        for ti in tf:
+            entry = _entry(ti)
+            if ti.isreg():
+                with tempfile.SpooledTemporaryFile(16 * 1024 * 1024) as spool:
+                    entry['sha256'] = _hash(tf.extractfile(ti), spool)
+                    if _changed(old.get(ti.name), entry):
+                        spool.seek(0)
+                        data = tarfile.TarInfo('files/' + ti.name)
+                        data.size = ti.size
+                        data.mode = ti.mode
+                        data.mtime = ti.mtime
+                        out.addfile(data, spool)
+            new[ti.name] = entry
+            if _changed(old.get(ti.name), entry):
+                changed[ti.name] = entry
+        removed = sorted([n for n in old if n not in new])
+        index = {
+            'version': version,
+            'from': os.path.basename(old_tar),
+            'to': os.path.basename(new_tar),
+            'old': dict([(n, old[n]) for n in removed + list(changed)
+                         if n in old]),
+            'changed': changed,
+            'removed': removed,
+            'unchanged': len(new) - len(changed)
+        }
+        data = json.dumps(index, indent=1, sort_keys=True).encode('utf-8')
+        ti = tarfile.TarInfo('delta.json')
+        ti.size = len(data)
+        out.addfile(ti, io.BytesIO(data))
+    manifest_save(bld, new_tar, new)
+    os.replace(tmp, delta_tar)
+    return index
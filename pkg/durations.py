@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Buildset Durations
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import json
+import os
+import threading
+
+_lock = threading.Lock()
+
+store = 'durations.json'
+
+
+def _path(bld):
+    return os.path.join(bld.path.get_bld().abspath(), store)
+
+
+def load(bld):
+    '''load the durations of buildsets from previous builds'''
+    try:
+        with open(_path(bld)) as f:
+            durations = json.load(f)
+    except (EnvironmentError, ValueError):
+        durations = {}
+    bld.buildset_durations = durations
+
+
+def estimate(bld, name):
+    '''a buildset's duration in seconds, unknown buildsets get the average'''
+    durations = getattr(bld, 'buildset_durations', {})
+    if name in durations:
+        return durations[name]
+    if len(durations) == 0:
+        return 1
+    return sum(durations.values()) // len(durations)
+
+
+def record(bld, name, duration):
+    '''save a buildset's duration for later builds'''
+    with _lock:
+        durations = getattr(bld, 'buildset_durations', {})
+        durations[name] = max(1, int(duration))
+        bld.buildset_durations = durations
+        path = _path(bld)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+        os.replace(path + '.tmp', path)
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Shared Sources
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+import os
+import shutil
+import threading
+
+_lock = threading.Lock()
+
+# The RSB's download directories
+dirs = ['sources', 'patches']
+
+
+def shared(bld):
+    '''the shared sources, the RSB's default is the directory it runs in'''
+    if bld.env.RSB_SOURCES:
+        return bld.env.RSB_SOURCES
+    return bld.path.abspath()
+
+
+def rsb_opts(path):
+    '''the RSB options to download into and use a sources directory'''
+    return ['--sourcedir=' + os.path.join(path, 'sources'),
+            '--patchdir=' + os.path.join(path, 'patches')]
+
+
+def prepare(shared, path):
+    '''link the shared downloads into a private sources directory
+
+    The RSB does not download a file that exists so only the files not
+    in the shared directory are downloaded. Concurrent downloads write
+    to separate directories and are moved into the shared directory
+    once complete.
+    '''
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    for d in dirs:
+        sd = os.path.join(shared, d)
+        pd = os.path.join(path, d)
+        os.makedirs(sd, exist_ok=True)
+        os.makedirs(pd)
+        for f in os.listdir(sd):
+            if not f.endswith('.tmp'):
+                os.symlink(os.path.join(sd, f), os.path.join(pd, f))
+
+
+def collect(shared, path):
+    '''move the downloads into the shared directory, return the count'''
+    count = 0
+    for d in dirs:
+        pd = os.path.join(path, d)
+        if not os.path.isdir(pd):
+            continue
+        for f in os.listdir(pd):
+            src = os.path.join(pd, f)
+            if os.path.islink(src):
+                continue
+            dst = os.path.join(shared, d, f)
+            with _lock:
+                if os.path.exists(dst):
+                    # Another download finished first
+                    continue
+                tmp = dst + '.tmp'
+                if os.path.isdir(tmp):
+                    shutil.rmtree(tmp)
+                elif os.path.exists(tmp):
+                    os.remove(tmp)
+                shutil.move(src, tmp)
+                os.replace(tmp, dst)
+            count += 1
+    shutil.rmtree(path)
+    return count
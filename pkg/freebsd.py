@@ -72,6 +72,9 @@ def ports_build(bld, build):
     else:
         rel = 'not-released'
 
+    from_tar = pkg.configs.pkg_from_tar(bld, build, bset)
+    tar = pkg.configs.pkg_tar(bld, bset, from_tar)
+
     subst_vars = {
         'RSB_BUILDROOT': '',
         'RSB_PKG_NAME': bset['name'],
@@ -79,7 +82,10 @@ def ports_build(bld, build):
         'RSB_VERSION': bld.env.RSB_VERSION,
         'RSB_REVISION': _esc_label(bld.env.RSB_REVISION),
         'RSB_RELEASED': rel,
-        'TARFILE': bset['tar'],
+        'TARFILE': tar['tar'],
+        'TAR_EXTRACT': tar['extract'],
+        'TAR_COMPRESS': tar['format'],
+        'RSB_FROM_TAR': from_tar,
         'RSB_SET_BUILDER': bset['cmd'],
         'RSB_SET_BUILDER_ARGS': ' '.join(bset['pkg-opts']),
         'RSB_WORK_PATH': bld.path.abspath(),
@@ -106,7 +112,7 @@ def ports_build(bld, build):
 
 
 def ports(bld):
-    for build in pkg.configs.find_buildsets(bld):
+    for build in pkg.configs.find_targets(bld):
         ports_build(bld, build)
 
 
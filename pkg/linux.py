@@ -36,7 +36,9 @@ import os.path
 import os
 import platform
 
+import pkg.ccache
 import pkg.configs
+import pkg.split
 
 from waflib import Build, TaskGen
 
@@ -87,39 +89,66 @@ def get_pkg_arch(packager: str) -> str:
     return arch_map[packager][machine]
 
 
+def user_config(ctx, packager, ini):
+    '''parse a packager's user configuration INI file once per context'''
+    configs = getattr(ctx, 'pkg_user_configs', None)
+    if configs is None:
+        configs = ctx.pkg_user_configs = {}
+    if packager not in configs:
+        if ini:
+            config = pkg.configs.get_config_parser()
+            try:
+                config.read(ini)
+            except pkg.configs.get_config_error() as ce:
+                ctx.fatal(packager + ' config parse error: ' + str(ce))
+        else:
+            config = None
+        configs[packager] = {
+            'config': config,
+            'values': None,
+            'sections': {}
+        }
+    return configs[packager]
+
+
+def user_config_render(bld, packager, ini, values, build, no_config):
+    '''render a buildset's user configuration, memoized per section'''
+    uc = user_config(bld, packager, ini)
+    section = build['buildset']
+    if section in uc['sections']:
+        return uc['sections'][section]
+    config = uc['config']
+    if config is None or not config.has_section(section):
+        uc['sections'][section] = no_config
+        return no_config
+    try:
+        items = config.items(section)
+    except pkg.configs.get_config_error() as ce:
+        bld.fatal(packager + ' config parse error: ' + str(ce))
+    if uc['values'] is None:
+        uc['values'] = []
+        if values:
+            for cv in values:
+                ci = cv.split('=', 1)
+                if len(ci) != 2:
+                    bld.fatal('invalid ' + packager.upper() +
+                              ' config value: ' + cv)
+                uc['values'] += ['%%define %s %s' % (ci[0], ci[1])]
+    lines = list(uc['values'])
+    for ci in items:
+        lines += ['%%define %s %s' % (ci[0], ci[1])]
+    uc['sections'][section] = os.linesep.join(lines)
+    return uc['sections'][section]
+
+
 def rpm_get_config(ctx):
-    if ctx.env.RPM_CONFIG:
-        config = pkg.configs.get_config_parser()
-        try:
-            config.read(ctx.env.RPM_CONFIG)
-        except pkg.configs.get_config_error() as ce:
-            ctx.fatal('rpm config parse error: ' + str(ce))
-    else:
-        config = None
-    return config
+    return user_config(ctx, 'rpm', ctx.env.RPM_CONFIG)['config']
 
 
 def rpm_config_parser(bld, build):
-    config = rpm_get_config(bld)
     no_config = '#  No user configuration, see ./waf --help and --rpm-config'
-    if config is None:
-        return no_config
-    if not config.has_section(build['buildset']):
-        return no_config
-    try:
-        items = config.items(build['buildset'])
-    except pkg.configs.get_config_error() as ce:
-        bld.fatal('rpm config parse error: ' + str(ce))
-    user_config = []
-    if bld.env.RPM_CONFIG_VALUES:
-        for cv in bld.env.RPM_CONFIG_VALUES:
-            ci = cv.split('=', 1)
-            if len(ci) != 2:
-                bld.fatal('invalid RPM config value: ' + cv)
-            user_config += ['%%define %s %s' % (ci[0], ci[1])]
-    for ci in items:
-        user_config += ['%%define %s %s' % (ci[0], ci[1])]
-    return os.linesep.join(user_config)
+    return user_config_render(bld, 'rpm', bld.env.RPM_CONFIG,
+                              bld.env.RPM_CONFIG_VALUES, build, no_config)
 
 
 def rpm_configure(conf):
@@ -146,38 +175,12 @@ def rpm_configure(conf):
 
 
 def deb_get_config(ctx):
-    if ctx.env.DEB_CONFIG:
-        config = pkg.configs.get_config_parser()
-        try:
-            config.read(ctx.env.DEB_CONFIG)
-        except pkg.configs.get_config_error() as ce:
-            ctx.fatal('deb config parse error: ' + str(ce))
-    else:
-        config = None
-    return config
+    return user_config(ctx, 'deb', ctx.env.DEB_CONFIG)['config']
 
 
 def deb_config_parser(bld, build):
-    config = deb_get_config(bld)
-    no_config = ''
-    if config is None:
-        return no_config
-    if not config.has_section(build['buildset']):
-        return no_config
-    try:
-        items = config.items(build['buildset'])
-    except pkg.configs.get_config_error() as ce:
-        bld.fatal('deb config parse error: ' + str(ce))
-    user_config = []
-    if bld.env.DEB_CONFIG_VALUES:
-        for cv in bld.env.DEB_CONFIG_VALUES:
-            ci = cv.split('=', 1)
-            if len(ci) != 2:
-                bld.fatal('invalid DEB config value: ' + cv)
-            user_config += ['%define %s %s' % (ci[0], ci[1])]
-    for ci in items:
-        user_config += ['%define %s %s' % (ci[0], ci[1])]
-    return os.linesep.join(user_config)
+    return user_config_render(bld, 'deb', bld.env.DEB_CONFIG,
+                              bld.env.DEB_CONFIG_VALUES, build, '')
 
 
 def deb_configure(conf):
@@ -213,6 +216,87 @@ def deb_configure(conf):
     conf.env.DEB_DATE = format_datetime(now)
 
 
+def rpm_split(bld, build, comps):
+    '''the RPM spec sections for the split components'''
+    if len(comps) == 0:
+        return {
+            'RSB_REQUIRES': '',
+            'RSB_SUBPACKAGES': '',
+            'RSB_FILES_OPTS': '',
+            'RSB_SUBPACKAGE_FILES': ''
+        }
+    requires = []
+    subpackages = []
+    files = []
+    excludes = []
+    for c in comps:
+        name = '%{rpm_name}-' + c['name']
+        requires += [
+            'Requires: %s = %%{rpm_version}-%s' % (name, c['release'])
+        ]
+        subpackages += [
+            '%package -n ' + name, 'Summary: %{rpm_summary} (' + c['name'] +
+            ')', 'Version: %{rpm_version}', 'Release: ' + c['release'], '',
+            '%description -n ' + name, '%{rpm_description}',
+            'This package contains the ' + c['name'] + ' component.', ''
+        ]
+        files += [
+            '%files -n ' + name + ' -f ' + c['files'].abspath(),
+            '%defattr(-,root,root)', ''
+        ]
+        excludes += [
+            '%exclude ' + f for f in c['files'].read().splitlines()
+        ]
+    exclude = c['files'].parent.make_node('rpm.exclude')
+    exclude.write(os.linesep.join(excludes) + os.linesep)
+    return {
+        'RSB_REQUIRES': os.linesep.join(requires),
+        'RSB_SUBPACKAGES': os.linesep.join(subpackages),
+        'RSB_FILES_OPTS': '-f ' + exclude.abspath(),
+        'RSB_SUBPACKAGE_FILES': os.linesep.join(files)
+    }
+
+
+def deb_split(bld, bset, comps):
+    '''the Debian control stanzas and rules for the split components'''
+    name = 'rtems-' + bset['name']
+    if len(comps) == 0:
+        return {
+            'DEB_DEPENDS': '',
+            'DEB_SUBPACKAGES': '',
+            'DEB_SPLIT_INSTALL': '',
+            'DEB_GENCONTROL': '\tdh_gencontrol'
+        }
+    depends = []
+    subpackages = []
+    install = []
+    gencontrol = []
+    for c in comps:
+        cname = name + '-' + c['name'].lower()
+        version = '%s-%s' % (bld.env.RSB_VERSION, c['release'])
+        depends += ['%s (= %s)' % (cname, version)]
+        subpackages += [
+            'Package: ' + cname,
+            'Architecture: ' + arch_map['deb'][platform.machine()],
+            'Depends: ${misc:Depends}',
+            'Description: RTEMS tools and board support package (' +
+            c['name'] + ')',
+            ' This package contains the ' + c['name'] + ' component.', ''
+        ]
+        install += [
+            '\tsh %s/pkg/split.sh debian/%s %s debian/%s' %
+            (bld.path.abspath(), name, c['files'].abspath(), cname)
+        ]
+        gencontrol += ['\tdh_gencontrol -p%s -- -v%s' % (cname, version)]
+    gencontrol += ['\tdh_gencontrol --remaining-packages']
+    return {
+        'DEB_DEPENDS': ', ' + ', '.join(depends),
+        'DEB_SUBPACKAGES': os.linesep.join(subpackages),
+        'DEB_SPLIT_INSTALL': os.linesep.join(install),
+        'DEB_GENCONTROL': os.linesep.join(gencontrol)
+    }
+
+
 def rpm_build(bld, build):
     user_rpm_config = rpm_config_parser(bld, build)
     bset = pkg.configs.buildset(bld, build, dry_run=False)
@@ -220,19 +304,14 @@ def rpm_build(bld, build):
     spec_file = _esc_name(build['buildset'])
     spec = bld.path.get_bld().find_or_declare(spec_file + '.spec')
     buildroot = bld.path.get_bld().find_or_declare('buildroot')
-    buildroot_BUILD = buildroot.find_or_declare('BUILD')
-    buildroot_BUILDROOT = buildroot.find_or_declare('BUILDROOT')
-    buildroot_RPMS = buildroot.find_or_declare('RPMS')
-    buildroot_SRPMS = buildroot.find_or_declare('SRPMS')
-    buildroot.mkdir()
-    buildroot_BUILD.mkdir()
-    buildroot_BUILDROOT.mkdir()
-    buildroot_RPMS.mkdir()
-    buildroot_SRPMS.mkdir()
     if bld.env.RSB_RELEASED:
         rel = 'released'
     else:
         rel = 'not-released'
+    from_tar = pkg.configs.pkg_from_tar(bld, build, bset)
+    split = rpm_split(bld, build,
+                      pkg.split.components(bld, build, bset, from_tar, 'rpm'))
+    tar = pkg.configs.pkg_tar(bld, bset, from_tar)
     bld(name=rpm_name,
         features='subst',
         description='Generate RPM spec file',
@@ -245,11 +324,16 @@ def rpm_build(bld, build):
         RSB_VERSION=bld.env.RSB_VERSION,
         RSB_REVISION=_esc_label(bld.env.RSB_REVISION),
         RSB_RELEASED=rel,
-        TARFILE=bset['tar'],
+        TARFILE=tar['tar'],
+        TAR_EXTRACT=tar['extract'],
+        RSB_FROM_TAR=from_tar,
         RSB_SET_BUILDER=bset['cmd'],
         RSB_SET_BUILDER_ARGS=' '.join(bset['pkg-opts']),
         RSB_WORK_PATH=bld.path,
-        USER_RPM_CONFIG=user_rpm_config)
+        RSB_STAGING=bset['staging'],
+        RSB_COMPILER_CACHE=pkg.ccache.rpm_exports(bld),
+        USER_RPM_CONFIG=user_rpm_config,
+        **split)
 
 
 def deb_build(bld, build):
@@ -260,13 +344,17 @@ def deb_build(bld, build):
     deb_dir = board_path + '.debian/debian'
 
     buildroot = bld.path.get_bld().find_or_declare('deb_buildroot')
-    buildroot.mkdir()
 
     if bld.env.RSB_RELEASED:
         rel = 'released'
     else:
         rel = 'not-released'
 
+    from_tar = pkg.configs.pkg_from_tar(bld, build, bset)
+    split = deb_split(bld, bset,
+                      pkg.split.components(bld, build, bset, from_tar, 'deb'))
+    tar = pkg.configs.pkg_tar(bld, bset, from_tar)
+
     # Consolidate all common substitution variables
     subst_vars = {
         'RSB_BUILDROOT': buildroot.abspath(),
@@ -276,13 +364,18 @@ def deb_build(bld, build):
         'RSB_VERSION': bld.env.RSB_VERSION,
         'RSB_REVISION': _esc_label(bld.env.RSB_REVISION),
         'RSB_RELEASED': rel,
-        'TARFILE': bset['tar'],
+        'TARFILE': tar['tar'],
+        'TAR_EXTRACT': tar['extract'],
+        'RSB_FROM_TAR': from_tar,
         'RSB_SET_BUILDER': bset['cmd'],
         'RSB_SET_BUILDER_ARGS': ' '.join(bset['pkg-opts']),
         'RSB_WORK_PATH': bld.path.abspath(),
+        'RSB_STAGING': bset['staging'].abspath(),
+        'RSB_COMPILER_CACHE': pkg.ccache.deb_exports(bld),
         'USER_DEB_CONFIG': user_deb_config,
         'DEB_DATE': bld.env.DEB_DATE
     }
+    subst_vars.update(split)
 
     bld(name='deb_control_' + bset['name'],
         features='subst',
@@ -314,13 +407,26 @@ def deb_build(bld, build):
         **subst_vars)
 
 
+def rpm_buildroot(bld):
+    buildroot = bld.path.get_bld().find_or_declare('buildroot')
+    buildroot.mkdir()
+    for d in ['BUILD', 'BUILDROOT', 'RPMS', 'SRPMS']:
+        buildroot.find_or_declare(d).mkdir()
+
+
 def deb(bld):
-    for build in pkg.configs.find_buildsets(bld):
+    builds = pkg.configs.find_targets(bld)
+    if len(builds) > 0:
+        bld.path.get_bld().find_or_declare('deb_buildroot').mkdir()
+    for build in builds:
         deb_build(bld, build)
 
 
 def rpmspec(bld):
-    for build in pkg.configs.find_buildsets(bld):
+    builds = pkg.configs.find_targets(bld)
+    if len(builds) > 0:
+        rpm_buildroot(bld)
+    for build in builds:
         rpm_build(bld, build)
 
 
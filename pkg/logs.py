@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Log Store
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+import gzip
+import json
+import os
+import re
+
+# The lines in the RSB's output and log that start a stage
+stage = re.compile(r'^(Build Set: (?!Time)|config: |package: |building: |' +
+                   r'cleaning: )')
+
+stage_output = re.compile(stage.pattern.encode())
+
+# The lines that report an error
+error = re.compile(r'^(error: |Build FAILED|Traceback )|: error: |' +
+                   r'\*\*\* .*Error [0-9]+|^ERROR')
+
+# A chunk is compressed separately so it can be read on its own
+chunk_size = 1024 * 1024
+
+index_version = 1
+
+
+def path(log):
+    '''the compressed log of an RSB log'''
+    return log + '.gz'
+
+
+def index_path(log):
+    return log + '.idx'
+
+
+class writer:
+    '''write lines as gzip members with an index of the lines in each'''
+
+    def __init__(self, log):
+        self.file = open(log, 'wb')
+        self.chunks = []
+        self.lines = 0
+        self.start = 0
+        self.buf = []
+        self.size = 0
+
+    def flush(self):
+        if len(self.buf) == 0:
+            return
+        data = gzip.compress(b''.join(self.buf), mtime=0)
+        self.chunks += [{
+            'line': self.start,
+            'lines': self.lines - self.start,
+            'offset': self.file.tell(),
+            'length': len(data)
+        }]
+        self.file.write(data)
+        self.start = self.lines
+        self.buf = []
+        self.size = 0
+
+    def write(self, line, boundary=False):
+        if boundary or self.size >= chunk_size:
+            self.flush()
+        self.buf += [line]
+        self.size += len(line)
+        self.lines += 1
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def store(src, log, stages=None, end=None):
+    '''compress an RSB log and index its stages and errors
+
+    The stages are the times and lines of the stages in the RSB's
+    output used to time the stages in the log.
+    '''
+    if stages is None:
+        stages = []
+    index = {
+        'version': index_version,
+        'log': os.path.basename(path(log)),
+        'stages': [],
+        'errors': []
+    }
+    out = writer(path(log) + '.tmp')
+    timed = 0
+    try:
+        with open(src, 'rb') as f:
+            for line in f:
+                text = line.decode('utf-8', 'replace').rstrip()
+                boundary = stage.match(text) is not None
+                if boundary:
+                    start = None
+                    if timed < len(stages) and stages[timed][1] == text:
+                        start = stages[timed][0]
+                        timed += 1
+                    index['stages'] += [{
+                        'name': text,
+                        'line': out.lines,
+                        'start': start
+                    }]
+                if error.search(text) is not None:
+                    index['errors'] += [{
+                        'line': out.lines,
+                        'stage': len(index['stages']) - 1,
+                        'text': text[:200]
+                    }]
+                out.write(line, boundary)
+    finally:
+        out.close()
+    stages = index['stages']
+    for s, n in zip(stages, stages[1:] + [{'start': end}]):
+        if s['start'] is not None and n['start'] is not None:
+            s['duration'] = n['start'] - s['start']
+        else:
+            s['duration'] = None
+    index['lines'] = out.lines
+    index['chunks'] = out.chunks
+    os.replace(path(log) + '.tmp', path(log))
+    with open(index_path(log) + '.tmp', 'w') as f:
+        json.dump(index, f, indent=1)
+    os.replace(index_path(log) + '.tmp', index_path(log))
+    os.remove(src)
+    return index
+
+
+def load(log):
+    '''load a log's index, None if there is no index'''
+    try:
+        with open(index_path(log)) as f:
+            index = json.load(f)
+    except (IOError, ValueError):
+        return None
+    if index.get('version') != index_version:
+        return None
+    return index
+
+
+def lines(log, index, first, last):
+    '''the numbered lines first to last only decompressing their chunks'''
+    first = max(0, first)
+    last = min(index['lines'], last)
+    out = []
+    with open(path(log), 'rb') as f:
+        for c in index['chunks']:
+            if c['line'] + c['lines'] <= first or c['line'] >= last:
+                continue
+            f.seek(c['offset'])
+            data = gzip.decompress(f.read(c['length']))
+            for n, l in enumerate(data.splitlines(), start=c['line']):
+                if n >= first and n < last:
+                    out += [(n, l.decode('utf-8', 'replace'))]
+    return out
+
+
+def failure(index):
+    '''the stage and line of the first error, or the end of the last stage
+
+    The stage is -1 if the error is before the first stage or the log
+    has no stages.
+    '''
+    if len(index['errors']) > 0:
+        e = index['errors'][0]
+        return e['stage'], e['line']
+    return len(index['stages']) - 1, index['lines'] - 1
+
+
+def stage_start(index, s):
+    '''the first line of a stage, stage -1 is the lines before any stage'''
+    if s < 0:
+        return 0
+    return index['stages'][s]['line']
+
+
+def stage_end(index, s):
+    if s + 1 < len(index['stages']):
+        return index['stages'][s + 1]['line']
+    return index['lines']
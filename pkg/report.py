@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Build Report
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import atexit
+import json
+import os
+import threading
+import time
+
+_lock = threading.Lock()
+
+report = 'build-report.json'
+
+
+def _path(bld):
+    return os.path.join(bld.path.get_bld().abspath(), report)
+
+
+def _write(bld):
+    path = _path(bld)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(bld.build_report, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def start(bld):
+    '''start a build report, buildsets are added as they finish
+
+    The empty report is written now so a report from an earlier build
+    is not left in place if no buildset finishes.
+    '''
+    bld.build_report = {
+        'rsb-version': bld.env.RSB_VERSION,
+        'rsb-revision': bld.env.RSB_REVISION,
+        'start': time.time(),
+        'buildsets': []
+    }
+    _write(bld)
+    # waf does not run the post functions if the build fails
+    bld.add_post_fun(summary)
+    atexit.register(summary, bld)
+
+
+def usage(ru):
+    '''the resource usage of a child process tree'''
+    if ru is None:
+        return {}
+    return {
+        'user': ru.ru_utime,
+        'system': ru.ru_stime,
+        'max-rss': ru.ru_maxrss * 1024,
+        'read': ru.ru_inblock * 512,
+        'written': ru.ru_oublock * 512
+    }
+
+
+def record(bld, name, result, start, end, ru, tar, cache=None):
+    '''add a buildset to the build report'''
+    entry = {
+        'buildset': name,
+        'result': result,
+        'start': start,
+        'end': end,
+        'wall': end - start
+    }
+    entry.update(usage(ru))
+    if tar is not None and os.path.exists(tar):
+        entry['tar-size'] = os.path.getsize(tar)
+    if cache is not None:
+        entry['compiler-cache'] = cache
+    with _lock:
+        if not hasattr(bld, 'build_report'):
+            return
+        bld.build_report['buildsets'] += [entry]
+        bld.build_report['end'] = end
+        _write(bld)
+
+
+def _mb(size):
+    if size is None:
+        return '-'
+    return '%.1f' % (size / (1024.0 * 1024.0))
+
+
+def _secs(secs):
+    if secs is None:
+        return '-'
+    return '%d:%02d:%02d' % (secs // 3600, (secs // 60) % 60, secs % 60)
+
+
+def _hits(cache):
+    if cache is None or cache['hits'] + cache['misses'] == 0:
+        return '-'
+    return '%d%%' % (100 * cache['hits'] // (cache['hits'] + cache['misses']))
+
+
+def summary(bld):
+    '''print a table of the buildsets built, once'''
+    if getattr(bld, 'build_report_printed', False):
+        return
+    bld.build_report_printed = True
+    entries = getattr(bld, 'build_report', {}).get('buildsets', [])
+    if len(entries) == 0:
+        return
+    cols = ['Buildset', 'Wall', 'User', 'System', 'RSS MB', 'Read MB',
+            'Write MB', 'Tar MB']
+    cache = any(['compiler-cache' in e for e in entries])
+    if cache:
+        cols += ['Cache Hits']
+    rows = []
+    for e in sorted(entries, key=lambda e: e['wall'], reverse=True):
+        rows += [[
+            e['buildset'],
+            _secs(e['wall']),
+            _secs(e.get('user')),
+            _secs(e.get('system')),
+            _mb(e.get('max-rss')),
+            _mb(e.get('read')),
+            _mb(e.get('written')),
+            _mb(e.get('tar-size'))
+        ]]
+        if cache:
+            rows[-1] += [_hits(e.get('compiler-cache'))]
+    widths = [max([len(c)] + [len(r[i]) for r in rows])
+              for i, c in enumerate(cols)]
+    fmt = '  '.join(['%-' + str(widths[0]) + 's'] +
+                    ['%' + str(w) + 's' for w in widths[1:]])
+    print(fmt % tuple(cols))
+    for r in rows:
+        print(fmt % tuple(r))
+    print('Report: ' + _path(bld))
@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Split Packages
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import time
+
+import pkg.compress
+import pkg.configs
+
+from waflib import Logs, Options
+
+
+def _esc_name(s):
+    return s.replace('_', '-')
+
+
+def component_tars(bld, build):
+    '''find the tar files of the buildset's components'''
+    bp = pkg.configs.bset_parse(bld, build['buildset'])
+    stage = pkg.configs.bset_stage(bld, build['buildset'])
+    tardir = bld.path.make_node('tar')
+    tars = []
+    for c in bp['configs']:
+        name = os.path.basename(c)
+        tar = tardir.make_node(name + pkg.compress.ext(bld.env.TAR_COMPRESS))
+        fmt = bld.env.TAR_COMPRESS
+        if stage is not None and stage['config'] == c:
+            # A shared stage's tar file is the component
+            stage_tar = bld.path.get_bld().make_node(
+                ['stage', stage['name'] + '.tar.bz2'])
+            if os.path.isfile(stage_tar.abspath()):
+                tar = stage_tar
+                fmt = pkg.compress.rsb_format
+        if os.path.isfile(tar.abspath()):
+            tars += [(_esc_name(name), tar, fmt)]
+    return tars
+
+
+def keys(bset, fmt, comps):
+    '''a key of the content each component packages from the buildset's
+    tar file'''
+    owner = {}
+    hashes = {}
+    for c in comps:
+        hashes[c['name']] = hashlib.sha256()
+        for f in c['members']:
+            owner[f] = c['name']
+    with pkg.compress.stream(bset['tar'].abspath(), fmt) as tf:
+        for ti in tf:
+            if ti.name not in owner:
+                continue
+            h = hashes[owner[ti.name]]
+            h.update(ti.name.encode('utf-8', 'replace'))
+            if ti.isreg():
+                f = tf.extractfile(ti)
+                for data in iter(lambda: f.read(1024 * 1024), b''):
+                    h.update(data)
+            elif ti.issym() or ti.islnk():
+                h.update(ti.linkname.encode('utf-8', 'replace'))
+    for c in comps:
+        c['key'] = hashes[c['name']].hexdigest()[:12]
+
+
+def releases(bset, build, comps):
+    '''a release for each component that increases when its key changes
+
+    The release is the UTC time the key was first seen followed by the
+    key. A key that has not changed keeps its release and if the record
+    is lost the new time is still later than any earlier release.
+    '''
+    record = bset['tar'].parent.make_node(
+        os.path.basename(build['buildset']) + '.components.json')
+    seen = {}
+    if os.path.isfile(record.abspath()):
+        try:
+            seen = json.loads(record.read())
+        except ValueError:
+            seen = {}
+    now = time.strftime('%Y%m%d%H%M%S', time.gmtime())
+    for c in comps:
+        last = seen.get(c['name'], {})
+        if last.get('key') != c['key'] or 'serial' not in last:
+            serial = now
+            if last.get('serial', '') >= serial:
+                serial = str(int(last['serial']) + 1)
+            last = {'key': c['key'], 'serial': serial}
+            seen[c['name']] = last
+        c['release'] = '%s.%s' % (last['serial'], c['key'])
+    record.write(json.dumps(seen, indent=2, sort_keys=True))
+
+
+def components(bld, build, bset, from_tar, packager):
+    '''split the buildset package into components, empty if not split
+
+    Each packager has its own directory of listings as the packages of
+    more than one packager can be created by a build.
+    '''
+    if not Options.options.split_packages:
+        return []
+    if from_tar != '1':
+        Logs.warn('split packages need a current tar file, not splitting: ' +
+                  build['buildset'])
+        return []
+    splitdir = bld.path.get_bld().make_node(
+        [build['buildset'] + '.split', packager])
+    if os.path.isdir(splitdir.abspath()):
+        shutil.rmtree(splitdir.abspath())
+    splitdir.mkdir()
+    try:
+        installed = pkg.compress.members(bset['tar'].abspath(),
+                                         bld.env.TAR_COMPRESS)
+    except (IOError, tarfile.TarError) as e:
+        bld.fatal('split packages: ' + str(e))
+    owned = set()
+    comps = []
+    try:
+        for name, tar, fmt in component_tars(bld, build):
+            files = sorted(pkg.compress.members(tar.abspath(), fmt))
+            # A file belongs to the first component that installs it and
+            # is in the buildset's tar file
+            files = [f for f in files if f in installed and f not in owned]
+            if len(files) == 0:
+                continue
+            owned.update(files)
+            listing = splitdir.make_node(name + '.files')
+            listing.write(
+                os.linesep.join(['/' + f for f in files]) + os.linesep)
+            comps += [{'name': name, 'members': set(files), 'files': listing}]
+        if len(comps) != 0:
+            keys(bset, bld.env.TAR_COMPRESS, comps)
+    except (IOError, tarfile.TarError) as e:
+        bld.fatal('split packages: ' + str(e))
+    releases(bset, build, comps)
+    return comps
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Shared Build Stages
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import os
+import shutil
+import tarfile
+import threading
+
+import pkg.compress
+
+_lock = threading.Lock()
+
+
+def _stamp(tar):
+    st = os.stat(tar)
+    return '%d:%d' % (st.st_size, st.st_mtime_ns)
+
+
+def _extractall(tf, path):
+    if hasattr(tarfile, 'tar_filter'):
+        tf.extractall(path, filter='tar')
+    else:
+        tf.extractall(path)
+
+
+def extract(tar, root):
+    '''extract a stage tar file to root if it is not already extracted'''
+    stamp = root + '.stamp'
+    with _lock:
+        st = _stamp(tar)
+        if os.path.isdir(root) and os.path.exists(stamp):
+            with open(stamp) as f:
+                if f.read() == st:
+                    return
+        if os.path.exists(root):
+            shutil.rmtree(root)
+        os.makedirs(root)
+        with tarfile.open(tar) as tf:
+            _extractall(tf, root)
+        with open(stamp, 'w') as f:
+            f.write(st)
+
+
+def merge(tar, tars, fmt):
+    '''merge the RSB tar files into tar in the format, later members are
+    extracted last'''
+    with pkg.compress.write(tar, fmt) as out:
+        for src in tars:
+            with pkg.compress.stream(src, pkg.compress.rsb_format) as tf:
+                for ti in tf:
+                    if ti.isreg():
+                        out.addfile(ti, tf.extractfile(ti))
+                    else:
+                        out.addfile(ti)
@@ -0,0 +1,98 @@
+#! /bin/sh
+# SPDX-License-Identifier: BSD-2-Clause
+
+#
+# RTEMS Deployment package buildroot staging
+#
+# Populate a package buildroot from a staging tree shared by the
+# packagers. If the file system supports reflinks the tar file is
+# extracted once per tar file and the tree is reflinked into the
+# buildroot. A reflink copies on write so the packagers can change the
+# files in the buildroot, for example dh_fixperms and the RPM strip
+# scripts. Without reflinks a copy of the tree costs more than
+# extracting the tar file so the tar file is extracted into the
+# buildroot and no staging tree is kept.
+#
+#  staging.sh <tar file> <tar extract options> <staging path> <buildroot>
+#
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+set -e
+
+if [ $# -ne 4 ]; then
+    echo "error: staging.sh <tar> <tar extract> <staging> <buildroot>" >&2
+    exit 1
+fi
+
+tar_file="$1"
+tar_extract="$2"
+staging="$3"
+buildroot="$4"
+
+mkdir -p "$(dirname "${staging}")" "${buildroot}"
+
+#
+# Probe if the buildroot can share the staging tree's file data
+#
+probe="${staging}.probe"
+touch "${probe}"
+if ! cp --reflink=always "${probe}" "${buildroot}/.staging-probe" \
+     2> /dev/null; then
+    rm -f "${probe}" "${buildroot}/.staging-probe"
+    eval tar ${tar_extract} '"${tar_file}"' -C '"${buildroot}"'
+    echo "staging: extracted ${tar_file} to ${buildroot}"
+    exit 0
+fi
+rm -f "${probe}" "${buildroot}/.staging-probe"
+
+#
+# The tree is keyed on the tar file's size and modification time so a
+# rebuilt tar file is extracted again without reading it to hash it
+#
+key=$(stat -L -c '%s-%Y' "${tar_file}")
+tree="${staging}/${key}"
+
+extract() {
+    if [ ! -f "${tree}.done" ]; then
+        rm -rf "${staging}"
+        mkdir -p "${tree}"
+        eval tar ${tar_extract} '"${tar_file}"' -C '"${tree}"'
+        touch "${tree}.done"
+    fi
+}
+
+if command -v flock > /dev/null 2>&1; then
+    (
+        flock 9
+        extract
+    ) 9> "${staging}.lock"
+else
+    extract
+fi
+
+cp -a --reflink=always "${tree}/." "${buildroot}/"
+echo "staging: reflinked ${tree} to ${buildroot}"
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Artifact Store
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+import os
+import shutil
+import threading
+
+import pkg.compress
+
+_lock = threading.Lock()
+
+
+def enabled(bld):
+    return bool(bld.env.ARTIFACT_STORE)
+
+
+def _path(bld, key):
+    return os.path.join(bld.env.ARTIFACT_STORE, key[:2],
+                        key + pkg.compress.ext(bld.env.TAR_COMPRESS))
+
+
+def lookup(bld, key):
+    '''the path of the tar file with the inputs key, None if not stored'''
+    if not enabled(bld):
+        return None
+    path = _path(bld, key)
+    if not os.path.isfile(path):
+        return None
+    return path
+
+
+def fetch(bld, key, tar):
+    '''copy the tar file with the inputs key to tar, False if not stored'''
+    path = lookup(bld, key)
+    if path is None:
+        return False
+    tmp = tar + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(tar), exist_ok=True)
+        shutil.copyfile(path, tmp)
+        # The most recently used tar files are evicted last
+        os.utime(path)
+    except EnvironmentError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+    os.replace(tmp, tar)
+    return True
+
+
+def add(bld, key, tar):
+    '''add a built tar file to the store and evict to the size limit'''
+    if not enabled(bld):
+        return
+    path = _path(bld, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    shutil.copyfile(tar, tmp)
+    os.replace(tmp, path)
+    evict(bld)
+
+
+def evict(bld):
+    '''remove the least recently used tar files over the size limit'''
+    limit = bld.env.ARTIFACT_STORE_SIZE
+    if not limit:
+        return
+    with _lock:
+        entries = []
+        for root, dirs, files in os.walk(bld.env.ARTIFACT_STORE):
+            for f in files:
+                if f.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, f)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries += [(st.st_mtime, st.st_size, path)]
+        size = sum([e[1] for e in entries])
+        for mtime, esize, path in sorted(entries):
+            if size <= limit:
+                break
+            try:
+                os.remove(path)
+                size -= esize
+            except OSError:
+                pass
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: BSD-2-Clause
+'''
+ Scratch Work Directories
+'''
+
+#
+# Copyright 2026 RTEMS Deployment contributors, see the git history
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+
+import fcntl
+import os
+import shutil
+import tempfile
+
+prefix = 'rtems-deploy-'
+
+lock_ext = '.lock'
+
+
+def enabled(bld):
+    return bool(bld.env.WORK_DIR)
+
+
+def _lock(bld):
+    '''create and lock a build's lock file, held until the build exits
+
+    A build's directory is the lock file's path without the extension.
+    A cleaner can remove the file between it being created and locked
+    so the lock is retried until the locked file is the one in place.
+    '''
+    while True:
+        fd, lock = tempfile.mkstemp(prefix=prefix,
+                                    suffix=lock_ext,
+                                    dir=bld.env.WORK_DIR)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.stat(lock).st_ino == os.fstat(fd).st_ino:
+                return fd, lock[:-len(lock_ext)]
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+
+def _path(bld):
+    if not hasattr(bld, 'work_path'):
+        bld.work_fd, bld.work_path = _lock(bld)
+    return bld.work_path
+
+
+def _remove(bld):
+    if not hasattr(bld, 'work_path'):
+        return
+    shutil.rmtree(bld.work_path, ignore_errors=True)
+    os.remove(bld.work_path + lock_ext)
+    os.close(bld.work_fd)
+
+
+def _stale(path):
+    '''remove a build's directory if its lock file is not locked'''
+    lock = path + lock_ext
+    try:
+        fd = os.open(lock, os.O_RDWR)
+    except FileNotFoundError:
+        # A build creates its lock file before its directory
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return
+    try:
+        shutil.rmtree(path, ignore_errors=True)
+        os.remove(lock)
+    except FileNotFoundError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def setup(bld):
+    '''remove the work directories of builds that did not clean up
+
+    A running build holds a lock on its lock file. The lock is released
+    when the build's process exits, and a lock works across PID
+    namespaces and hosts sharing the work directory where a process ID
+    does not.
+    '''
+    if not enabled(bld):
+        return
+    _path(bld)
+    bld.add_post_fun(_remove)
+    for d in os.listdir(bld.env.WORK_DIR):
+        if not d.startswith(prefix):
+            continue
+        if d.endswith(lock_ext):
+            d = d[:-len(lock_ext)]
+        path = os.path.join(bld.env.WORK_DIR, d)
+        if path != bld.work_path:
+            _stale(path)
+
+
+def acquire(bld, name):
+    '''create a unique work directory for a buildset'''
+    if not enabled(bld):
+        return None
+    work = _path(bld)
+    os.makedirs(work, exist_ok=True)
+    return tempfile.mkdtemp(prefix=name.replace('/', '-') + '-', dir=work)
+
+
+def release(bld, work):
+    '''remove a buildset's work directory'''
+    if work is None:
+        return
+    shutil.rmtree(work, ignore_errors=True)